@@ -1,8 +1,9 @@
-import json
+import orjson
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List
 import logging
 import os
@@ -16,11 +17,42 @@ from .movie_rag.llm_provider import LLMProvider
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+movie_rag = None
+llm_provider = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build clients per worker process (the Scylla driver isn't fork-safe)"""
+    global movie_rag, llm_provider
+
+    # Initialize recommender
+    try:
+        movie_rag = MovieRAG()
+        logger.info("MovieRecommender initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize MovieRecommender: {e}")
+        movie_rag = None
+
+    # Initialize LLM provider (reused across requests to keep the Groq connection pool warm)
+    try:
+        llm_provider = LLMProvider()
+        logger.info("LLMProvider initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize LLMProvider: {e}")
+        llm_provider = None
+
+    yield
+
+    if movie_rag is not None:
+        movie_rag.scylla_client.shutdown()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Movie Recommendation API",
     description="Get movie recommendations using ScyllaDB Vector Search",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 current_dir = os.path.dirname(os.path.abspath(__file__))
 static_dir = os.path.join(current_dir, "static")
@@ -32,14 +64,6 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
 # Add templates
 templates = Jinja2Templates(directory=templates_dir)
 
-# Initialize recommender
-try:
-    movie_rag = MovieRAG()
-    logger.info("MovieRecommender initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize MovieRecommender: {e}")
-    movie_rag = None
-
 # Request/Response models
 class RecommendationRequest(BaseModel):
     query: str
@@ -49,6 +73,21 @@ class RecommendationResponse(BaseModel):
     movies: List[Movie]
     query: str
     total_results: int
+
+class BatchRecommendationRequest(BaseModel):
+    queries: List[str] = Field(min_length=1, max_length=32)
+    top_k: int = 5
+
+class BatchRecommendationResponse(BaseModel):
+    results: List[RecommendationResponse]
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with pydantic-core directly. Returning a Response
+    skips FastAPI's response_model re-validation, which would otherwise undo
+    the `Movie.model_construct` shortcut.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
     
 
 @app.post("/recommend", response_model=RecommendationResponse)
@@ -62,13 +101,13 @@ async def post_recommendations(request: RecommendationRequest):
         )
     
     try:
-        movies = movie_rag.similar_movies(request.query, request.top_k)
+        movies = await movie_rag.similar_movies(request.query, request.top_k)
         
-        return RecommendationResponse(
+        return model_response(RecommendationResponse(
             movies=movies,
             query=request.query,
             total_results=len(movies)
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error getting recommendations: {e}")
@@ -78,6 +117,38 @@ async def post_recommendations(request: RecommendationRequest):
         )
 
 
+@app.post("/recommend/batch", response_model=BatchRecommendationResponse)
+async def post_batch_recommendations(request: BatchRecommendationRequest):
+    """Get movie recommendations for multiple queries in one request"""
+    
+    if movie_rag is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Movie recommender service is not available"
+        )
+    
+    try:
+        movie_lists = await movie_rag.similar_movies_batch(request.queries, request.top_k)
+        
+        return model_response(BatchRecommendationResponse(
+            results=[
+                RecommendationResponse(
+                    movies=movies,
+                    query=query,
+                    total_results=len(movies)
+                )
+                for query, movies in zip(request.queries, movie_lists)
+            ]
+        ))
+        
+    except Exception as e:
+        logger.error(f"Error getting batch recommendations: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get recommendations: {str(e)}"
+        )
+
+
 @app.get("/start-sse", response_class=HTMLResponse)
 async def start_bot_message(request: Request, query, top_k):
     context = {"request": request,
@@ -98,7 +169,7 @@ async def index(request: Request):
 async def generate_story_stream(request: Request, query: str, top_k: int):
     """Turn any movie plot into a Scylla story"""
 
-    if movie_rag is None:
+    if movie_rag is None or llm_provider is None:
         raise HTTPException(
             status_code=503,
             detail="Service is not available"
@@ -113,31 +184,30 @@ async def generate_story_stream(request: Request, query: str, top_k: int):
     The plot: {plot}"""
     
     try:
-        llm_provider = LLMProvider()
-        movies = movie_rag.similar_movies(query, top_k)
+        movies = await movie_rag.similar_movies(query, top_k)
         movie = movies[0]
         rag_movie_plot = movie.plot
         context_prompt = llm_context_prompt.format(plot=rag_movie_plot)
         
-        def stream_generator():
+        async def stream_generator():
             # Send movie data first
             movie_data = {
                 "title": movie.title,
                 "poster_url": movie.poster_url,
                 "plot": movie.plot
             }
-            yield f"event: movie_data\ndata: {json.dumps(movie_data)}\n\n"
+            yield b"event: movie_data\ndata: " + orjson.dumps(movie_data) + b"\n\n"
             
             # Stream content chunks
-            for chunk in llm_provider.generate_response_stream(
+            async for chunk in llm_provider.generate_response_stream_async(
                 "You are a chatbot, follow instructions", 
                 context_prompt
             ):
                 if chunk and chunk.strip():
-                    yield f"event: content\ndata: {chunk}\n\n"
+                    yield f"event: content\ndata: {chunk}\n\n".encode()
             
             # Send done event
-            yield f"event: done\ndata: {json.dumps({'status': 'complete'})}\n\n"
+            yield b"event: done\ndata: " + orjson.dumps({"status": "complete"}) + b"\n\n"
         
         return StreamingResponse(
             stream_generator(), 
@@ -156,9 +226,16 @@ async def generate_story_stream(request: Request, query: str, top_k: int):
 # Run the app
 if __name__ == "__main__":
     import uvicorn
+    # Workers come from WEB_CONCURRENCY only, the same variable EmbeddingCreator
+    # divides the CPU by, so the two can't disagree
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     uvicorn.run(
-        "app:app",
+        "chatbot.app:app",
         host="0.0.0.0",
         port=3000,
-        reload=True
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=False,
+        backlog=2048
     )
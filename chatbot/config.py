@@ -12,3 +12,6 @@ SCYLLADB_CONFIG = {
 }
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
+
+# Quantized ONNX variant of the embedding model; picked from the CPU when unset
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE", "")
@@ -0,0 +1,39 @@
+def cql_statements(lines):
+    """
+    Yield statements from CQL source lines, splitting on `;` outside of
+    quoted literals. Comments (`--`, `//` and `/* */`) are dropped so
+    quotes or semicolons inside them don't affect the split.
+    """
+    statement = []
+    quote = None
+    in_block_comment = False
+    for line in lines:
+        i = 0
+        while i < len(line):
+            char = line[i]
+            pair = line[i:i + 2]
+            if in_block_comment:
+                if pair == "*/":
+                    in_block_comment = False
+                    statement.append(" ")
+                    i += 1
+            elif quote:
+                statement.append(char)
+                if char == quote:
+                    quote = None
+            elif pair in ("--", "//"):
+                statement.append("\n")
+                break
+            elif pair == "/*":
+                in_block_comment = True
+                i += 1
+            elif char in ("'", '"'):
+                quote = char
+                statement.append(char)
+            elif char == ";":
+                yield "".join(statement)
+                statement = []
+            else:
+                statement.append(char)
+            i += 1
+    yield "".join(statement)
@@ -1,5 +1,6 @@
 import os
 from scylladb import ScyllaClient
+from cql import cql_statements
 
 client = ScyllaClient()
 session = client.get_session()
@@ -10,8 +11,8 @@ def absolute_file_path(relative_file_path):
 
 print("Creating keyspace and tables...")
 with open(absolute_file_path("schema.cql"), "r") as file:
-    for query in file.read().split(";"):
-        if len(query) > 0:
+    for query in cql_statements(file):
+        if query.strip():
             session.execute(query)
 print("Migration completed.")
 
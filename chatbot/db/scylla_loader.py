@@ -3,11 +3,11 @@ import psutil
 import time
 import threading
 from tqdm import tqdm
-from multiprocessing import Event, Process, Value, cpu_count
+from multiprocessing import Event, Process, Queue, cpu_count
 from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT, Session
 from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.query import dict_factory
+from cassandra.query import PreparedStatement, dict_factory
 from cassandra.concurrent import execute_concurrent_with_args
 
 
@@ -24,6 +24,7 @@ class ScyllaLoader:
                 user="scylla", 
                 port=9042, 
                 dc=""):
+        self._prepared_cache: dict[tuple[str, tuple[str, ...]], PreparedStatement] = {}
         self.session = self.create_session(host, passwd, keyspace, user, port, dc)
 
     def create_session(self,
@@ -47,29 +48,25 @@ class ScyllaLoader:
         )
         return cluster.connect(keyspace)
 
-    def _start_monitor(self, counter, total_rows, event):
-        """Start progress monitoring thread"""
+    def _start_monitor(self, progress_q, total_rows):
+        """
+        Start progress monitoring thread, fed by batch sizes posted by workers.
+        Blocks on the queue until the parent posts a `None` sentinel.
+        """
         pbar = tqdm(total=total_rows, dynamic_ncols=True, unit="req")
 
         def monitor():
-            last = 0
-            while last < total_rows and not event.is_set():
-                with counter.get_lock():
-                    current = counter.value
-                if current > last:
-                    pbar.update(current - last)
-                    last = current
-                else:
-                    time.sleep(0.1)
+            while (processed := progress_q.get()) is not None:
+                pbar.update(processed)
             pbar.close()
 
         thread = threading.Thread(target=monitor, daemon=True)
         thread.start()
-        return thread
+        return thread, pbar
 
     def _worker(self, args):
         """Worker process function for data ingestion"""
-        (worker_id, concurrency, data_chunk, event, insert_stmt, counter) = args
+        (worker_id, concurrency, data_chunk, event, insert_stmt, progress_q) = args
 
         try:
             p = psutil.Process(os.getpid())
@@ -81,18 +78,14 @@ class ScyllaLoader:
         session = self.create_session()
         prepared_stmt = session.prepare(insert_stmt)
 
-        # Convert dictionaries to tuples for batch insertion
-        batch_data = []
-        for item in data_chunk:
-            # Convert dict to tuple maintaining key order
-            row_tuple = tuple(item.values())
-            batch_data.append(row_tuple)
-
         # Insert data in batches
         batch_size = concurrency
 
-        for i in range(0, len(batch_data), batch_size):
-            batch = batch_data[i : i + batch_size]
+        for i in range(0, len(data_chunk), batch_size):
+            # Another worker gave up after repeated failures, stop early
+            if event.is_set():
+                break
+            batch = data_chunk[i : i + batch_size]
             attempt = 0
             while attempt < self.MAX_RETRIES:
                 try:
@@ -108,11 +101,10 @@ class ScyllaLoader:
                         session.shutdown()
                         return
                     time.sleep(self.RETRY_DELAY * (2**attempt))
-            with counter.get_lock():
-                counter.value += len(batch)
+            progress_q.put(len(batch))
         session.shutdown()
 
-    def _create_chunks(self, data: list[dict], process_count: int) -> list[list[dict]]:
+    def _create_chunks(self, data: list[tuple], process_count: int) -> list[list[tuple]]:
         """Split data into chunks for multiprocessing"""
         chunk_size = len(data) // process_count
         remainder = len(data) % process_count
@@ -154,22 +146,25 @@ class ScyllaLoader:
 
         process_count = cpu_count()
 
+        # Convert dicts to tuples once, in column order, before handing rows to workers
+        columns = list(data[0].keys())
+        rows = [tuple(item[c] for c in columns) for item in data]
+
         # Split data among processes
         event = Event()
-        data_chunks = self._create_chunks(data, process_count)
+        data_chunks = self._create_chunks(rows, process_count)
 
-        # Progress tracker counter
-        counter = Value("i", 0)
+        # Progress tracker queue
+        progress_q = Queue()
         row_count = len(data)
-        progress_thread = self._start_monitor(counter, row_count, event)
+        progress_thread, pbar = self._start_monitor(progress_q, row_count)
 
         # Prepare arguments for each worker
-        columns = list(data[0].keys())
         insert_stmt = self._generate_insert_statement(keyspace, table, columns)
         worker_args_list = []
         for i, chunk in enumerate(data_chunks):
             if chunk:
-                worker_args = (i, concurrency, chunk, event, insert_stmt, counter)
+                worker_args = (i, concurrency, chunk, event, insert_stmt, progress_q)
                 worker_args_list.append(worker_args)
 
         # Start worker processes
@@ -185,13 +180,13 @@ class ScyllaLoader:
             p.join()
 
         # Stop progress monitoring
-        event.set()
-        progress_thread.join(timeout=1)
+        progress_q.put(None)
+        progress_thread.join()
 
         duration = time.time() - start_time
-        if counter.value < row_count:
+        if pbar.n < row_count:
             print(
-                f"❌ Aborted due to repeated failures. Processed {counter.value}/{row_count} records."
+                f"❌ Aborted due to repeated failures. Processed {pbar.n}/{row_count} records."
             )
         else:
             print(f"✅ Done running {row_count} operations in {duration:.2f} seconds.")
@@ -209,10 +204,14 @@ class ScyllaLoader:
             keyspace: Keyspace name
             table: Table name
         """
-        columns = list(data.keys())
-        values = list(data.values())
-        insert_query = f"""
-        INSERT INTO {table} ({','.join(columns)}) 
-        VALUES ({','.join(['%s' for c in columns])});
-        """
-        self.session.execute(insert_query, values)
+        columns = tuple(sorted(data.keys()))
+        key = (table, columns)
+        prepared = self._prepared_cache.get(key)
+        if prepared is None:
+            insert_query = f"""
+            INSERT INTO {table} ({','.join(columns)}) 
+            VALUES ({','.join(['?' for c in columns])});
+            """
+            prepared = self.session.prepare(insert_query)
+            self._prepared_cache[key] = prepared
+        self.session.execute(prepared, [data[c] for c in columns])
@@ -1,7 +1,12 @@
 from cassandra.cluster import Cluster, ExecutionProfile, EXEC_PROFILE_DEFAULT
-from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
+from cassandra.policies import (
+    ConstantSpeculativeExecutionPolicy,
+    DCAwareRoundRobinPolicy,
+    TokenAwarePolicy,
+)
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.query import dict_factory
+from cassandra.query import PreparedStatement, dict_factory
+import asyncio
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 import config
@@ -9,6 +14,7 @@ import config
 class ScyllaClient():
     
     def __init__(self, keyspace: str = ""):
+        self._prepared_cache: dict[tuple[str, tuple[str, ...]], PreparedStatement] = {}
         self.cluster = self._get_cluster(config.SCYLLADB_CONFIG)
         if keyspace != "":
             self.session = self.cluster.connect(keyspace)
@@ -29,13 +35,18 @@ class ScyllaClient():
             load_balancing_policy=TokenAwarePolicy(
                     DCAwareRoundRobinPolicy(local_dc=config["datacenter"])
                 ),
+                # Retry a slow read on another replica after 50 ms. Only applies
+                # to idempotent statements and needs RF > 1 to have a spare replica.
+                speculative_execution_policy=ConstantSpeculativeExecutionPolicy(
+                    delay=0.05, max_attempts=2
+                ),
                 row_factory=dict_factory
             )
         return Cluster(
             execution_profiles={EXEC_PROFILE_DEFAULT: profile},
             contact_points=[config["host"], ],
             port=config["port"],
-            compression=False,
+            compression="lz4",
             auth_provider = PlainTextAuthProvider(username=config["username"],
                                                   password=config["password"]))
     
@@ -50,14 +61,39 @@ class ScyllaClient():
         return self.session
     
     def insert_data(self, table, data: dict):
-        columns = list(data.keys())
-        values = list(data.values())
-        insert_query = f"""
-        INSERT INTO {table} ({','.join(columns)}) 
-        VALUES ({','.join(['%s' for c in columns])});
-        """
-        self.session.execute(insert_query, values)
+        columns = tuple(sorted(data.keys()))
+        key = (table, columns)
+        prepared = self._prepared_cache.get(key)
+        if prepared is None:
+            insert_query = f"""
+            INSERT INTO {table} ({','.join(columns)}) 
+            VALUES ({','.join(['?' for c in columns])});
+            """
+            prepared = self.session.prepare(insert_query)
+            self._prepared_cache[key] = prepared
+        self.session.execute(prepared, [data[c] for c in columns])
         
     def query_data(self, query, params=[]):
         rows = self.session.execute(query, params)
-        return rows.all()
\ No newline at end of file
+        return rows.all()
+
+    async def query_async(self, query, params=[]):
+        """Execute a query via execute_async and await its rows from asyncio."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        # The awaiting task may be cancelled (e.g. client disconnect) before the driver answers
+        def set_result(rows):
+            if not future.done():
+                future.set_result(rows)
+
+        def set_exception(exc):
+            if not future.done():
+                future.set_exception(exc)
+
+        response_future = self.session.execute_async(query, params)
+        response_future.add_callbacks(
+            lambda rows: loop.call_soon_threadsafe(set_result, rows),
+            lambda exc: loop.call_soon_threadsafe(set_exception, exc)
+        )
+        return await future
\ No newline at end of file
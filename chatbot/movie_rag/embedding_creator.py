@@ -1,8 +1,46 @@
+import os
+import platform
+from functools import lru_cache
+import onnxruntime
 from sentence_transformers import SentenceTransformer
+from config import EMBEDDING_ONNX_FILE
+
+def _default_onnx_file_name() -> str:
+    """
+    Pick the quantized ONNX export matching the host CPU.
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return 'onnx/model_qint8_arm64.onnx'
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            flags = cpuinfo.read()
+    except OSError:
+        flags = ""
+    if "avx512_vnni" in flags:
+        return 'onnx/model_qint8_avx512_vnni.onnx'
+    return 'onnx/model_quint8_avx2.onnx'
 
 class EmbeddingCreator:
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
-        self.embedding_model = SentenceTransformer(model_name, device='cpu')
+    def __init__(self,
+                 model_name: str = 'all-MiniLM-L6-v2',
+                 onnx_file_name: str = ""):
+        onnx_file_name = onnx_file_name or EMBEDDING_ONNX_FILE or _default_onnx_file_name()
+        # Share the CPU between uvicorn workers (WEB_CONCURRENCY is uvicorn's worker count)
+        workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = max(1, (os.cpu_count() or 1) // workers)
+        self.embedding_model = SentenceTransformer(
+            model_name,
+            device='cpu',
+            backend='onnx',
+            model_kwargs={
+                "file_name": onnx_file_name,
+                "provider": "CPUExecutionProvider",
+                "session_options": session_options,
+            }
+        )
+        # Per-instance cache, so repeated queries skip the forward pass
+        self._cached_embedding = lru_cache(maxsize=1024)(self._encode)
             
     
     def create_embedding(self, text: str) -> list[float]:
@@ -10,4 +48,17 @@ class EmbeddingCreator:
         Get embedding for a single text input using SentenceTransformer.
         Returns the embedding vector.
         """
-        return self.embedding_model.encode(text).tolist()
\ No newline at end of file
+        return list(self._cached_embedding(text))
+
+    def create_embeddings(self, texts: list[str], batch_size: int = 64) -> list[list[float]]:
+        """
+        Get embeddings for multiple text inputs in a single encoder call.
+        Returns the embedding vectors in input order.
+        """
+        return self.embedding_model.encode(texts, batch_size=batch_size).tolist()
+
+    def _encode(self, text: str) -> tuple[float, ...]:
+        """
+        Encoder call behind the per-instance `_cached_embedding` LRU.
+        """
+        return tuple(self.embedding_model.encode(text).tolist())
@@ -1,24 +1,23 @@
-from groq import Groq
+from groq import AsyncGroq
 from config import GROQ_API_KEY
 
 class LLMProvider:    
     def __init__(self, model_name="llama-3.1-8b-instant"):
         self.model_name = model_name
-        self.client = Groq(api_key=GROQ_API_KEY)
+        self.aclient = AsyncGroq(api_key=GROQ_API_KEY)
         
-    def generate_response_stream(self, system_prompt: str, prompt: str):
+    async def generate_response_stream_async(self, system_prompt: str, prompt: str):
         messages = [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ]
-        response = self.client.chat.completions.create(
+        response = await self.aclient.chat.completions.create(
                             model=self.model_name,
                             messages=messages, # type: ignore
                             stream=True,
                             max_tokens=150
                         )
-        for chunk in response:
+        async for chunk in response:
             content = chunk.choices[0].delta.content
             if content:
                 yield content
-        
\ No newline at end of file
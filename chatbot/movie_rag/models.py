@@ -1,9 +1,8 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
+from pydantic import BaseModel, Field
 
-@dataclass
-class Movie():
+class Movie(BaseModel):
     id: int
     title: Optional[str] = None
     release_date: Optional[datetime] = None
@@ -12,4 +11,5 @@ class Movie():
     poster_url: Optional[str] = None
     imdb_id: Optional[str] = None
     plot: Optional[str] = None
-    plot_embedding: Optional[list[float]] = None
\ No newline at end of file
+    # Not selected by the ANN query and never part of API responses
+    plot_embedding: Optional[list[float]] = Field(default=None, exclude=True)
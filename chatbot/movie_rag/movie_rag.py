@@ -1,21 +1,75 @@
+import asyncio
+from collections import OrderedDict
 from ..db.scylladb import ScyllaClient
 from .embedding_creator import EmbeddingCreator
 from .models import Movie
     
 class MovieRAG:
+
+    SIMILAR_MOVIES_CACHE_SIZE = 1024
     
     def __init__(self):
+        self._similar_movies_cache: OrderedDict[tuple[str, int], tuple[Movie, ...]] = OrderedDict()
         self.scylla_client = ScyllaClient()
         self.embedding_creator = EmbeddingCreator()
+        self.ann_stmt = self.scylla_client.session.prepare(
+            """
+            SELECT id, title, release_date, tagline, genre, poster_url, imdb_id, plot
+            FROM recommend.movies
+            ORDER BY plot_embedding ANN OF ? LIMIT ?
+            """
+        )
+        self.ann_stmt.is_idempotent = True
     
-    def similar_movies(self, movie_plot: str, top_k=5) -> list[Movie]:
-        db_client = ScyllaClient()
-        user_query_embedding = self.embedding_creator.create_embedding(movie_plot)
-        db_query = f"""
-                    SELECT *
-                    FROM recommend.movies
-                    ORDER BY plot_embedding ANN OF %s LIMIT %s;
-                   """
-        values = [user_query_embedding, int(top_k)]
-        results = db_client.query_data(db_query, values)
-        return [Movie(**row) for row in results]
+    async def similar_movies(self, movie_plot: str, top_k=5) -> list[Movie]:
+        key = (movie_plot.strip().lower(), int(top_k))
+        movies = self._cache_get(key)
+        if movies is None:
+            movies = await self._query_similar_movies(*key)
+            self._cache_put(key, movies)
+        return list(movies)
+
+    async def similar_movies_batch(self, movie_plots: list[str], top_k=5) -> list[list[Movie]]:
+        """
+        Shares the (query, top_k) cache with `similar_movies`; only the misses
+        are batch-encoded and sent as concurrent ANN queries.
+        """
+        keys = [(plot.strip().lower(), int(top_k)) for plot in movie_plots]
+        found = {key: self._cache_get(key) for key in keys}
+        misses = [key for key, movies in found.items() if movies is None]
+        if misses:
+            # Encoding is CPU-bound, keep it off the event loop
+            embeddings = await asyncio.to_thread(
+                self.embedding_creator.create_embeddings, [plot for plot, _ in misses]
+            )
+            results = await asyncio.gather(*(
+                self._ann_query(embedding, key[1])
+                for key, embedding in zip(misses, embeddings)
+            ))
+            for key, movies in zip(misses, results):
+                found[key] = movies
+                self._cache_put(key, movies)
+        return [list(found[key]) for key in keys]
+
+    def _cache_get(self, key: tuple[str, int]) -> tuple[Movie, ...] | None:
+        movies = self._similar_movies_cache.get(key)
+        if movies is not None:
+            self._similar_movies_cache.move_to_end(key)
+        return movies
+
+    def _cache_put(self, key: tuple[str, int], movies: tuple[Movie, ...]):
+        self._similar_movies_cache[key] = movies
+        if len(self._similar_movies_cache) > self.SIMILAR_MOVIES_CACHE_SIZE:
+            self._similar_movies_cache.popitem(last=False)
+
+    async def _query_similar_movies(self, movie_plot: str, top_k: int) -> tuple[Movie, ...]:
+        # Encoding is CPU-bound, keep it off the event loop
+        user_query_embedding = await asyncio.to_thread(
+            self.embedding_creator.create_embedding, movie_plot
+        )
+        return await self._ann_query(user_query_embedding, top_k)
+
+    async def _ann_query(self, embedding: list[float], top_k: int) -> tuple[Movie, ...]:
+        results = await self.scylla_client.query_async(self.ann_stmt, [embedding, top_k])
+        # Rows come back already typed by the driver, so skip validation
+        return tuple(Movie.model_construct(**row) for row in results)
@@ -0,0 +1,45 @@
+import io
+
+from chatbot.db.cql import cql_statements
+
+
+def split(source: str) -> list[str]:
+    return [s.strip() for s in cql_statements(io.StringIO(source)) if s.strip()]
+
+
+def test_splits_on_top_level_semicolons():
+    assert split("CREATE TABLE a (x int);\nCREATE TABLE b (y int);") == [
+        "CREATE TABLE a (x int)",
+        "CREATE TABLE b (y int)",
+    ]
+
+
+def test_ignores_semicolons_in_quoted_literals():
+    assert split("INSERT INTO t VALUES ('a;b', \"c;d\");") == [
+        "INSERT INTO t VALUES ('a;b', \"c;d\")",
+    ]
+
+
+def test_handles_doubled_quote_escapes():
+    assert split("INSERT INTO t VALUES ('it''s;ok');SELECT 1;") == [
+        "INSERT INTO t VALUES ('it''s;ok')",
+        "SELECT 1",
+    ]
+
+
+def test_drops_comments():
+    source = (
+        "-- don't do this;\n"
+        "CREATE TABLE a (x int); // it's fine;\n"
+        "/* multi-line; it's\n still a comment */ INSERT INTO t VALUES ('a;b','it''s');"
+    )
+    assert split(source) == [
+        "CREATE TABLE a (x int)",
+        "INSERT INTO t VALUES ('a;b','it''s')",
+    ]
+
+
+def test_statements_span_lines():
+    assert split("CREATE TABLE a (\n  x int,\n  s text\n);") == [
+        "CREATE TABLE a (\n  x int,\n  s text\n)",
+    ]
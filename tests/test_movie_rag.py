@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# movie_rag imports the SentenceTransformer-backed encoder
+pytest.importorskip("sentence_transformers")
+
+from chatbot.movie_rag import movie_rag as movie_rag_module
+
+
+class FakeScyllaClient:
+    def __init__(self):
+        self.session = SimpleNamespace(prepare=lambda query: SimpleNamespace(query=query))
+        self.queries = []
+
+    async def query_async(self, query, params):
+        embedding, top_k = params
+        self.queries.append(embedding)
+        return [{"id": i, "title": f"{embedding[0]}-{i}"} for i in range(top_k)]
+
+
+class FakeEmbeddingCreator:
+    def __init__(self):
+        self.single = []
+        self.batches = []
+
+    def create_embedding(self, text):
+        self.single.append(text)
+        return [text]
+
+    def create_embeddings(self, texts):
+        self.batches.append(texts)
+        return [[text] for text in texts]
+
+
+@pytest.fixture
+def rag(monkeypatch):
+    monkeypatch.setattr(movie_rag_module, "ScyllaClient", FakeScyllaClient)
+    monkeypatch.setattr(movie_rag_module, "EmbeddingCreator", FakeEmbeddingCreator)
+    return movie_rag_module.MovieRAG()
+
+
+def test_similar_movies_caches_normalized_queries(rag):
+    first = asyncio.run(rag.similar_movies(" Heist ", 2))
+    second = asyncio.run(rag.similar_movies("heist", 2))
+
+    assert [m.title for m in first] == ["heist-0", "heist-1"]
+    assert second == first
+    assert second is not first
+    assert rag.scylla_client.queries == [["heist"]]
+
+
+def test_similar_movies_evicts_least_recently_used(rag):
+    rag.SIMILAR_MOVIES_CACHE_SIZE = 2
+
+    async def scenario():
+        await rag.similar_movies("a", 1)
+        await rag.similar_movies("b", 1)
+        # Hit on "a" moves it to the end, so "b" is evicted next
+        await rag.similar_movies("a", 1)
+        await rag.similar_movies("c", 1)
+        await rag.similar_movies("a", 1)
+        await rag.similar_movies("b", 1)
+
+    asyncio.run(scenario())
+    assert rag.scylla_client.queries == [["a"], ["b"], ["c"], ["b"]]
+    assert list(rag._similar_movies_cache) == [("a", 1), ("b", 1)]
+
+
+def test_similar_movies_batch_only_queries_misses(rag):
+    async def scenario():
+        await rag.similar_movies("a", 1)
+        return await rag.similar_movies_batch(["A", "b", "b "], 1)
+
+    results = asyncio.run(scenario())
+    assert [[m.title for m in movies] for movies in results] == [["a-0"], ["b-0"], ["b-0"]]
+    assert rag.embedding_creator.batches == [["b"]]
+    assert rag.scylla_client.queries == [["a"], ["b"]]
+    assert ("b", 1) in rag._similar_movies_cache
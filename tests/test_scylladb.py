@@ -0,0 +1,96 @@
+import asyncio
+import threading
+
+import pytest
+
+from chatbot.db.scylladb import ScyllaClient
+
+
+class FakeResponseFuture:
+    """Mimics the driver's ResponseFuture, firing callbacks from another thread."""
+
+    def __init__(self):
+        self.callback = None
+        self.errback = None
+
+    def add_callbacks(self, callback, errback):
+        self.callback = callback
+        self.errback = errback
+
+    def _fire(self, fn, arg):
+        thread = threading.Thread(target=fn, args=(arg,))
+        thread.start()
+        thread.join()
+
+    def deliver(self, rows):
+        self._fire(self.callback, rows)
+
+    def fail(self, exc):
+        self._fire(self.errback, exc)
+
+
+class FakeSession:
+    def __init__(self):
+        self.response_future = FakeResponseFuture()
+        self.calls = []
+
+    def execute_async(self, query, params):
+        self.calls.append((query, params))
+        return self.response_future
+
+
+def make_client(session):
+    client = ScyllaClient.__new__(ScyllaClient)
+    client.session = session
+    return client
+
+
+async def started(coro):
+    task = asyncio.create_task(coro)
+    # Let the task reach execute_async and register its callbacks
+    await asyncio.sleep(0)
+    return task
+
+
+def test_query_async_returns_rows():
+    async def scenario():
+        session = FakeSession()
+        task = await started(make_client(session).query_async("SELECT", [1]))
+        session.response_future.deliver([{"id": 1}])
+        return await task, session.calls
+
+    rows, calls = asyncio.run(scenario())
+    assert rows == [{"id": 1}]
+    assert calls == [("SELECT", [1])]
+
+
+def test_query_async_propagates_errors():
+    async def scenario():
+        session = FakeSession()
+        task = await started(make_client(session).query_async("SELECT", []))
+        session.response_future.fail(RuntimeError("timeout"))
+        await task
+
+    with pytest.raises(RuntimeError, match="timeout"):
+        asyncio.run(scenario())
+
+
+def test_query_async_ignores_callback_after_cancellation():
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        loop_errors = []
+        loop.set_exception_handler(lambda loop, context: loop_errors.append(context))
+
+        session = FakeSession()
+        task = await started(make_client(session).query_async("SELECT", []))
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        session.response_future.deliver([{"id": 1}])
+        # Run the callback scheduled via call_soon_threadsafe
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return loop_errors
+
+    assert asyncio.run(scenario()) == []